@@ -3,7 +3,9 @@
 Intented to be used by "CLI" and in "development environement".
 """
 
+import re
 import sys
+import runpy
 import logging
 import tempfile
 import pickle
@@ -11,6 +13,7 @@ import typing
 import os
 import os.path
 import functools
+import threading
 
 from typing import Optional
 from pathlib import Path
@@ -42,9 +45,96 @@ def read_setuppy_args(
     return _read_setuppy_args(path_to_setup)
 
 
+class _SetupParamsCaptured(BaseException):
+    """Used to pass parameters of `bigflow.build.setup()` back to `_read_setuppy_args_inprocess`.
+
+    Inherits `BaseException`, so `except Exception:` inside `setup.py` doesn't intercept it."""
+
+    def __init__(self, params: dict):
+        super().__init__()
+        self.params = params
+
+
+# Enabled while `setup.py` is executed by `_read_setuppy_args_inprocess`
+_capture_setup_params = threading.local()
+
+
+# Any of `import bigflow.build`, `from bigflow.build import ...`, `from bigflow import build`
+_BIGFLOW_BUILD_RE = re.compile(r"\bbigflow\.build\b|\bfrom\s+bigflow\s+import\b[^\n]*\bbuild\b")
+
+
 @functools.lru_cache()
 def _read_setuppy_args(path_to_setup: Path) -> dict:
     logger.info("Read project options from %s", path_to_setup)
+    if _can_read_setuppy_args_inprocess(path_to_setup):
+        try:
+            return _read_setuppy_args_inprocess(path_to_setup)
+        except SystemExit as e:
+            logger.debug("File %s exited (code %s) - fallback to subprocess", path_to_setup, e.code)
+    return _read_setuppy_args_subprocess(path_to_setup)
+
+
+def _can_read_setuppy_args_inprocess(path_to_setup: Path) -> bool:
+    if threading.active_count() > 1:
+        # `os.chdir` and `sys.argv` are process-wide, don't break other threads
+        logger.debug("Other threads are running - read %s in subprocess", path_to_setup)
+        return False
+    try:
+        content = Path(path_to_setup).read_text(errors='replace')
+    except OSError:
+        return False
+    if not _BIGFLOW_BUILD_RE.search(content):
+        logger.debug("File %s doesn't use `bigflow.build` - read it in subprocess", path_to_setup)
+        return False
+    return True
+
+
+def _read_setuppy_args_inprocess(path_to_setup: Path) -> dict:
+    """Executes `setup.py` inside current interpreter, captures parameters passed to `bigflow.build.setup()`.
+
+    Temporarily changes cwd, `sys.argv` and `sys.path`, so must not be called when other threads are running.
+    Project modules imported by `setup.py` are removed from `sys.modules` afterwards."""
+
+    project_dir = os.path.abspath(path_to_setup.parent)
+    saved_cwd, saved_argv, saved_syspath = os.getcwd(), sys.argv, sys.path[:]
+    saved_modules = set(sys.modules)
+
+    # `setup.py` is executed as a script - mimic python interpreter
+    os.chdir(project_dir)
+    sys.argv = [str(path_to_setup), DUMP_PARAMS_SETUPPY_CMDARG, os.devnull]
+    sys.path.insert(0, project_dir)
+    _capture_setup_params.enabled = True
+    try:
+        runpy.run_path(str(path_to_setup), run_name="__main__")
+    except _SetupParamsCaptured as e:
+        return e.params
+    finally:
+        _capture_setup_params.enabled = False
+        sys.path[:] = saved_syspath
+        sys.argv = saved_argv
+        os.chdir(saved_cwd)
+        _forget_project_modules(project_dir, saved_modules)
+
+    raise ValueError(f"File {path_to_setup} doesn't call `bigflow.build.setup`")
+
+
+def _forget_project_modules(project_dir: str, saved_modules: typing.Set[str]):
+    prefix = os.path.join(project_dir, "")
+    for name in set(sys.modules) - saved_modules:
+        if name == "bigflow" or name.startswith("bigflow."):
+            continue  # keep single instance of bigflow, even when project dir contains it
+        module_file = getattr(sys.modules[name], '__file__', None)
+        if module_file and os.path.abspath(module_file).startswith(prefix):
+            logger.debug("Unload module %s imported by setup.py", name)
+            del sys.modules[name]
+
+
+def _maybe_capture_setup_params(params: dict):
+    if getattr(_capture_setup_params, 'enabled', False):
+        raise _SetupParamsCaptured(params)
+
+
+def _read_setuppy_args_subprocess(path_to_setup: Path) -> dict:
     with tempfile.NamedTemporaryFile("r+b") as f:
         bf_commons.run_process(
             ["python", path_to_setup, DUMP_PARAMS_SETUPPY_CMDARG, f.name],
@@ -219,9 +219,11 @@ def run_setup_command(prj: spec.BigflowProjectSpec, command, options=None):
 
 
 def _maybe_dump_setup_params(params):
+    bigflow.build.dev._maybe_capture_setup_params(params)
     if len(sys.argv) == 3 and sys.argv[1] == bigflow.build.dev.DUMP_PARAMS_SETUPPY_CMDARG:
-        with open(sys.argv[2], 'w+b') as out:
-            pickle.dump(params, out)
+        with open(sys.argv[2], 'wb') as out:
+            # dumper and reader may run on different pythons, protocol 5 needs 3.8+
+            pickle.dump(params, out, protocol=4)
         sys.exit(0)
 
 
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import os
+import hashlib
+import functools
 import subprocess
+import concurrent.futures
 import shutil
 import logging
 import typing
@@ -52,6 +55,13 @@ def run_tests_pytest(project_spec: BigflowProjectSpec):
     junit_xml = Path("./build/junit-reports/report.xml").absolute()
     junit_xml.parent.mkdir(parents=True, exist_ok=True)
     color = sys.stdout.isatty()
+
+    if project_spec.test_parallel and _is_xdist_available():
+        logger.debug("Plugin 'pytest-xdist' is available - run tests in parallel")
+        xdist_args = ["--numprocesses", "auto"]
+    else:
+        xdist_args = []
+
     bf_commons.run_process(
         [
             "python",
@@ -59,10 +69,21 @@ def run_tests_pytest(project_spec: BigflowProjectSpec):
             "-m", "pytest",
             "--color", ("yes" if color else "auto"),
             "--junit-xml", str(junit_xml),
+            *xdist_args,
         ],
     )
 
 
+def _is_xdist_available() -> bool:
+    # check interpreter which actually runs tests, it may differ from the one running bigflow
+    try:
+        bf_commons.run_process(["python", "-c", "import xdist"], verbose=False)
+    except subprocess.SubprocessError:
+        logger.warning("Plugin 'pytest-xdist' is not installed - run tests sequentially")
+        return False
+    return True
+
+
 def run_tests_unittest(project_spec: BigflowProjectSpec):
     output_dir = "build/junit-reports"
     bf_commons.run_process([
@@ -73,10 +94,64 @@ def run_tests_unittest(project_spec: BigflowProjectSpec):
     ])
 
 
-def _export_docker_image_to_file(tag: str, target_dir: Path, version: str):
-    image_target_path = target_dir / f"image-{version}.tar"
-    logger.info("Exporting the image to %s ...", image_target_path)
-    bf_commons.run_process(["docker", "image", "save", "-o", image_target_path, bf_commons.get_docker_image_id(tag)])
+def _export_docker_image_to_file(tag: str, target_dir: Path, version: str, compress: bool = False):
+    compressor = None
+    if compress:
+        compressor = shutil.which("pigz") or shutil.which("gzip")
+        if not compressor:
+            logger.warning("Neither 'pigz' nor 'gzip' is available - export uncompressed image")
+
+    image_id = bf_commons.get_docker_image_id(tag)
+    if not compressor:
+        image_target_path = target_dir / f"image-{version}.tar"
+        logger.info("Exporting the image to %s ...", image_target_path)
+        bf_commons.run_process(["docker", "image", "save", "-o", image_target_path, image_id])
+        return
+
+    image_target_path = target_dir / f"image-{version}.tar.gz"
+    logger.info("Exporting the image to %s (compress with %s) ...", image_target_path, compressor)
+    save_cmd = ["docker", "image", "save", image_id]
+    compress_cmd = [compressor, "-1", "-c"]
+    with open(image_target_path, 'wb') as out:
+        save = subprocess.Popen(save_cmd, stdout=subprocess.PIPE)
+        try:
+            compress = subprocess.Popen(compress_cmd, stdin=save.stdout, stdout=out)
+            save.stdout.close()  # `docker` receives SIGPIPE when compressor exits
+            compress_code = compress.wait()
+        except BaseException:
+            save.stdout.close()
+            save.kill()
+            raise
+        finally:
+            save_code = save.wait()
+
+    if save_code:
+        raise subprocess.CalledProcessError(save_code, save_cmd)
+    if compress_code:
+        raise subprocess.CalledProcessError(compress_code, compress_cmd)
+
+
+_BUILDX_BUILDER = "bigflow"
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_buildx_builder(name: str = _BUILDX_BUILDER) -> str:
+    try:
+        bf_commons.run_process(["docker", "buildx", "inspect", name], verbose=False)
+    except subprocess.SubprocessError:
+        logger.info("Create docker buildx builder %r", name)
+        bf_commons.run_process(["docker", "buildx", "create", "--driver", "docker-container", "--name", name])
+    return name
+
+
+@functools.lru_cache(maxsize=None)
+def _is_buildx_available() -> bool:
+    try:
+        bf_commons.run_process(["docker", "buildx", "version"], verbose=False)
+    except (subprocess.SubprocessError, OSError):
+        logger.warning("Docker plugin 'buildx' is not available - fallback to `docker build`")
+        return False
+    return True
 
 
 def _build_docker_image(
@@ -86,10 +161,18 @@ def _build_docker_image(
 ):
 
     logger.debug("Run docker build...")
-    cmd = ["docker", "build", project_spec.project_dir, "--tag", tag]
+    buildx = _is_buildx_available()
+    if buildx:
+        cmd = ["docker", "buildx", "build", project_spec.project_dir, "--tag", tag, "--load", "--progress=plain"]
+    else:
+        cmd = ["docker", "build", project_spec.project_dir, "--tag", tag]
 
     if cache_params:
 
+        if buildx:
+            # default 'docker' driver can't export cache into registry
+            cmd.extend(["--builder", _ensure_buildx_builder()])
+
         logger.debug("Authenticate to docker registry")
         bigflow.deploy.authenticate_to_registry(
             auth_method=cache_params.auth_method or bigflow.deploy.AuthorizationType.LOCAL_ACCOUNT,
@@ -106,11 +189,59 @@ def _build_docker_image(
             logger.debug("Add --cache-from=%s to `docker build`", image)
             cmd.extend(["--cache-from", image])
 
-    # noop when building backend is not a buildkit
+        if buildx:
+            # registry is available - share all layers (including intermediate stages) between builds
+            buildcache = f"{project_spec.docker_repository}:buildcache"
+            logger.debug("Use registry cache %s", buildcache)
+            cmd.extend([
+                "--cache-from", f"type=registry,ref={buildcache}",
+                "--cache-to", f"type=registry,ref={buildcache},mode=max",
+            ])
+
     logger.debug("Enable buildkit inline cache")
     cmd.extend(["--build-arg", "BUILDKIT_INLINE_CACHE=1"])
 
-    return bf_commons.run_process(cmd)
+    if buildx:
+        return bf_commons.run_process(cmd)
+    else:
+        # older docker clients enable buildkit only on demand
+        return bf_commons.run_process(cmd, env_add={'DOCKER_BUILDKIT': "1"})
+
+
+_DOCKERIGNORE_HEADER = "# autogenerated by bigflow, remove this line to customize the file"
+
+# Don't exclude 'dist' - it contains the project wheel, installed by Dockerfile
+_DOCKERIGNORE_CONTENT = textwrap.dedent(f"""\
+    {_DOCKERIGNORE_HEADER}
+    .git
+    .dags
+    build
+    **/*.egg-info
+    **/__pycache__
+    **/.pytest_cache
+    **/.mypy_cache
+""")
+
+
+def _ensure_dockerignore(project_dir: Path):
+    """Excludes build leftovers from docker build context (better caching, faster context upload)."""
+
+    dockerignore = Path(project_dir) / ".dockerignore"
+    if dockerignore.exists():
+        content = dockerignore.read_text()
+        if not content.startswith(_DOCKERIGNORE_HEADER):
+            logger.debug("Keep custom %s", dockerignore)
+            return
+        if content == _DOCKERIGNORE_CONTENT:
+            logger.debug("File %s is fresh", dockerignore)
+            return
+        logger.info("Update %s", dockerignore)
+    else:
+        logger.warning(
+            "Create %s to exclude build leftovers from docker build context. "
+            "Commit the file into your repository or remove the first line to customize it.", dockerignore)
+
+    dockerignore.write_text(_DOCKERIGNORE_CONTENT)
 
 
 @dataclass()
@@ -141,6 +272,7 @@ def build_image(
 
     tag = bf_commons.build_docker_image_tag(project_spec.docker_repository, project_spec.version)
     logger.info("Generated image tag: %s", tag)
+    _ensure_dockerignore(project_spec.project_dir)
     _build_docker_image(project_spec, tag, cache_params)
 
     if export_image_tar:
@@ -173,7 +305,7 @@ def _export_image_as_tag(project_spec, image_dir, tag):
 
 def _export_image_as_tar(project_spec, image_dir, tag):
     try:
-        _export_docker_image_to_file(tag, image_dir, project_spec.version)
+        _export_docker_image_to_file(tag, image_dir, project_spec.version, project_spec.compress_image_tar)
     finally:
         logger.info(
                 "Trying to remove the docker image. Tag: %s, image ID: %s",
@@ -195,21 +327,15 @@ def build_dags(
     project_spec: BigflowProjectSpec,
     start_time: str,
     workflow_id: typing.Optional[str] = None,
+    workflows: list[tuple[bigflow.Workflow, str]] | None = None,
 ):
-    # TODO: Move common functions from bigflow.cli to bigflow.commons (or other shared module)
-    from bigflow.cli import walk_workflows
-
-    logger.debug('Loading workflow(s)...')
-    workflows = []
-    for root_package in project_spec.packages:
-        if "." in root_package:
-            # leaf package
-            continue
-
-        for workflow in walk_workflows(project_spec.project_dir / root_package):
-            if workflow_id is not None and workflow_id != workflow.workflow_id:
-                continue
-            workflows.append((workflow, root_package))
+    if workflows is None:
+        workflows = _walk_project_workflows(project_spec)
+    workflows = [
+        (workflow, root_package)
+        for workflow, root_package in workflows
+        if workflow_id is None or workflow_id == workflow.workflow_id
+    ]
 
     if not workflows:
         if not workflow_id:
@@ -237,11 +363,34 @@ def build_dags(
     logger.info("Generated %d DAG files", len(workflows))
 
 
+def _walk_project_workflows(project_spec: BigflowProjectSpec) -> list[tuple[bigflow.Workflow, str]]:
+    """Imports all root packages, returns found workflows paired with the name of their root package."""
+
+    # TODO: Move common functions from bigflow.cli to bigflow.commons (or other shared module)
+    from bigflow.cli import walk_workflows
+
+    logger.debug('Loading workflow(s)...')
+    workflows = []
+    for root_package in project_spec.packages:
+        if "." in root_package:
+            # leaf package
+            continue
+        for workflow in walk_workflows(project_spec.project_dir / root_package):
+            workflows.append((workflow, root_package))
+    return workflows
+
+
 def _rmtree(p: Path):
     logger.info("Removing directory %s", p)
     shutil.rmtree(p, ignore_errors=True)
 
 
+def _rmtrees(ps: typing.List[Path]):
+    # directories are independent - overlap latency of `unlink` syscalls
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(_rmtree, ps))
+
+
 def clear_image_leftovers(project_spec: BigflowProjectSpec):
     _rmtree(project_spec.project_dir / ".image")
 
@@ -250,7 +399,7 @@ def clear_dags_leftovers(project_spec: BigflowProjectSpec):
     _rmtree(project_spec.project_dir / ".dags")
 
 
-def build_package(project_spec: BigflowProjectSpec):
+def build_package(project_spec: BigflowProjectSpec, force_tests: bool = False):
     logger.info('Building python package')
 
     req_in = Path(project_spec.project_requirements_file)
@@ -266,16 +415,97 @@ def build_package(project_spec: BigflowProjectSpec):
 
     bigflow.build.dataflow.dependency_checker.check_beam_worker_dependencies_conflict(req_in)
 
-    clear_package_leftovers(project_spec)
-    run_tests(project_spec)
+    build_dir = project_spec.project_dir / "build"
+    tests_stamp = build_dir / ".tests.stamp"
+    tests_digest = _compute_tests_inputs_digest(project_spec)
+    tests_fresh = (
+        not force_tests
+        and tests_stamp.exists()
+        and tests_stamp.read_text() == tests_digest
+        and (build_dir / "junit-reports").exists()  # report of the last run is still published
+    )
+
+    clear_package_leftovers(project_spec, keep_tests_results=tests_fresh)
+    if tests_fresh:
+        logger.info("Project files were not changed since the last successful test run - skip tests")
+    else:
+        run_tests(project_spec)
+
+    tests_stamp.parent.mkdir(parents=True, exist_ok=True)
+    tests_stamp.write_text(tests_digest)
 
     bigflow.build.dist.run_setup_command(project_spec, 'bdist_wheel')
 
 
-def clear_package_leftovers(project_spec: BigflowProjectSpec):
-    _rmtree(project_spec.project_dir / "build")
-    _rmtree(project_spec.project_dir / "dist")
-    _rmtree(project_spec.project_dir / f"{project_spec.name}.egg")
+# Generated by bigflow/setuptools/git in the project root, content of such directories doesn't affect tests.
+_BUILD_ARTIFACTS_DIRS = frozenset([
+    "build", "dist", ".image", ".dags", ".git",
+])
+
+# Generated by python & tools at any depth.
+_CACHE_DIRS = frozenset([
+    "__pycache__", ".pytest_cache", ".mypy_cache",
+])
+
+# Generated by bigflow during the build (see `_ensure_dockerignore`), don't affect tests.
+_BUILD_ARTIFACTS_FILES = frozenset([
+    ".dockerignore",
+])
+
+# Results of the last test run, kept in 'build/' when tests are skipped.
+_TESTS_RESULTS_FILES = frozenset([
+    "junit-reports", ".tests.stamp",
+])
+
+
+def _compute_tests_inputs_digest(project_spec: BigflowProjectSpec) -> str:
+    """Calculates hash of all project files (paths, sizes and modification times) and python interpreter."""
+
+    project_dir = str(project_spec.project_dir)
+    logger.debug("Calculate hash of files in %s", project_dir)
+
+    h = hashlib.sha256()
+    h.update(f"{project_spec.test_framework}\0{sys.executable}\0{sys.version}\n".encode())
+    for dirpath, dirnames, filenames in os.walk(project_dir):
+        is_root = dirpath == project_dir
+        dirnames[:] = sorted(
+            d for d in dirnames
+            if d not in _CACHE_DIRS
+            and not d.endswith(".egg-info")
+            and not (is_root and d in _BUILD_ARTIFACTS_DIRS)
+        )
+        for fn in sorted(filenames):
+            if fn in _BUILD_ARTIFACTS_FILES:
+                continue
+            path = os.path.join(dirpath, fn)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:  # broken symlink
+                continue
+            h.update(f"{os.path.relpath(path, project_dir)}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+    return h.hexdigest()
+
+
+def clear_package_leftovers(project_spec: BigflowProjectSpec, keep_tests_results: bool = False):
+    build_dir = project_spec.project_dir / "build"
+    leftovers = [
+        project_spec.project_dir / "dist",
+        project_spec.project_dir / f"{project_spec.name}.egg",
+    ]
+
+    if keep_tests_results and build_dir.is_dir():
+        logger.info("Removing content of %s, keep results of the last test run", build_dir)
+        for p in build_dir.iterdir():
+            if p.name in _TESTS_RESULTS_FILES:
+                continue
+            if p.is_dir() and not p.is_symlink():
+                leftovers.append(p)
+            else:
+                p.unlink()
+    else:
+        leftovers.append(build_dir)
+
+    _rmtrees(leftovers)
 
 
 def build_project(
@@ -284,10 +514,12 @@ def build_project(
     workflow_id: str | None = None,
     export_image_tar: bool | None = None,
     cache_params: BuildImageCacheParams | None = None,
+    force_tests: bool = False,
 ):
     logger.info("Build the project")
-    build_dags(project_spec, start_time, workflow_id=workflow_id)
-    build_package(project_spec)
+    workflows = _walk_project_workflows(project_spec)  # scan modules only once
+    build_dags(project_spec, start_time, workflow_id=workflow_id, workflows=workflows)
+    build_package(project_spec, force_tests=force_tests)
     build_image(
         project_spec,
         export_image_tar=export_image_tar,
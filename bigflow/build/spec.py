@@ -1,11 +1,13 @@
 """Read and parse bigflow project configuration (setup.py / pyproject.toml)"""
 
+import os
 import functools
 import textwrap
 import typing
 import logging
 import typing
 import dataclasses
+import concurrent.futures
 import toml
 
 from pathlib import Path
@@ -69,7 +71,9 @@ class BigflowProjectSpec:
     setuptools: typing.Dict[str, typing.Any]
 
     test_framework: Literal['pytest', 'unittest']
+    test_parallel: bool
     export_image_tar: bool
+    compress_image_tar: bool
 
 
 def parse_project_spec(
@@ -85,7 +89,9 @@ def parse_project_spec(
     project_requirements_file="resources/requirements.txt",
     resources_dir="resources",
     test_framework='unittest',
+    test_parallel=False,
     export_image_tar=True,
+    compress_image_tar=False,
     **kwargs,
 
 ) -> BigflowProjectSpec:
@@ -94,15 +100,22 @@ def parse_project_spec(
     logger.info("Prepare bigflow project spec...")
     name = name.replace("_", "-")  # PEP8 compliant package names
 
-    docker_repository = docker_repository or get_docker_repository_from_deployment_config(project_dir / deployment_config_file)
-    version = version or secure_get_version()
-    packages = packages if packages is not None else discover_project_packages(project_dir)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
 
-    if requries is None:
-        try:
-            requries = read_project_requirements(project_dir / project_requirements_file)
-        except FileNotFoundError as e:
-            logger.error("Can't read requirements file: %s", e)
+        # version detection spawns several `git` processes - run it in background
+        version_future = executor.submit(secure_get_version) if not version else None
+
+        docker_repository = docker_repository or get_docker_repository_from_deployment_config(project_dir / deployment_config_file)
+        packages = packages if packages is not None else discover_project_packages(project_dir)
+
+        if requries is None:
+            try:
+                requries = read_project_requirements(project_dir / project_requirements_file)
+            except FileNotFoundError as e:
+                logger.error("Can't read requirements file: %s", e)
+
+        if version_future:
+            version = version_future.result()
 
     metainfo = {k: kwargs.pop(k) for k in _PROJECT_METAINFO_KEYS if k in kwargs}
 
@@ -130,7 +143,9 @@ def parse_project_spec(
         metainfo=metainfo,
         setuptools=kwargs,
         test_framework=test_framework,
+        test_parallel=test_parallel,
         export_image_tar=export_image_tar,
+        compress_image_tar=compress_image_tar,
     )
 
 
@@ -147,7 +162,9 @@ def render_project_spec(prj: BigflowProjectSpec) -> dict:
         # 'data_files': prj.data_files,  # https://github.com/uiri/toml/issues/270
         'resources_dir': prj.resources_dir,
         'test_framework': prj.test_framework,
+        'test_parallel': prj.test_parallel,
         'export_image_tar': prj.export_image_tar,
+        'compress_image_tar': prj.compress_image_tar,
         **prj.metainfo,
         **prj.setuptools,
     }
@@ -246,11 +263,9 @@ def read_project_requirements(project_requirements_file):
 def get_docker_repository_from_deployment_config(deployment_config_file: Path) -> str:
     logger.info("Read docker repository from %s", deployment_config_file)
 
-    import bigflow.cli   # TODO: refactor, remove this import
-    try:
-        config = bigflow.cli.import_deployment_config(str(deployment_config_file), 'docker_repository')
-    except ValueError as e:
-        raise ValueError(f"Can't find the specified deployment configuration: {deployment_config_file}") from e
+    if not os.path.exists(deployment_config_file):
+        raise ValueError(f"Can't find the specified deployment configuration: {deployment_config_file}")
+    config = _load_deployment_config(str(deployment_config_file), os.stat(deployment_config_file).st_mtime_ns)
 
     if isinstance(config, bigflow.Config):
         config = config.resolve()
@@ -264,13 +279,31 @@ def get_docker_repository_from_deployment_config(deployment_config_file: Path) -
     return docker_repository
 
 
+@functools.lru_cache(maxsize=8)
+def _load_deployment_config(deployment_config_file: str, mtime_ns: int):
+    # 'mtime_ns' is a part of cache key only - reimport config after it was modified
+    import bigflow.cli   # TODO: refactor, remove this import
+    return bigflow.cli.import_deployment_config(deployment_config_file, 'docker_repository')
+
+
 def secure_get_version() -> str:
+    version = os.environ.get("BIGFLOW_VERSION")
+    if version:
+        logger.info("Use project version %s from $BIGFLOW_VERSION", version)
+        return version
+
     logger.debug("Autodetected project version using git")
     try:
-        version = bigflow.version.get_version()
+        version = _detect_version_cached(os.getcwd())
         logger.info("Autodetected project version is %s", version)
         return version
     except Exception as e:
         logger.error("Can't get the current package version. To use the automatic versioning, "
                      "you need to use git inside your project directory: %s", e)
         return "INVALID"
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_version_cached(cwd: str) -> str:
+    # 'git' is spawned several times per call, detect version only once per build
+    return bigflow.version.get_version()
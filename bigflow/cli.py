@@ -298,11 +298,20 @@ def _create_build_parser(subparsers):
     parser = subparsers.add_parser('build', description='Builds a Docker image, DAG files and .whl package from local sources.')
     _add_build_dags_parser_arguments(parser)
     _add_build_image_parser_arguments(parser)
+    _add_build_package_parser_arguments(parser)
     _add_parsers_common_arguments(parser)
 
 
 def _create_build_package_parser(subparsers):
-    subparsers.add_parser('build-package', description='Builds .whl package from local sources.')
+    parser = subparsers.add_parser('build-package', description='Builds .whl package from local sources.')
+    _add_build_package_parser_arguments(parser)
+
+
+def _add_build_package_parser_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        '--force-tests', dest='force_tests', action='store_true',
+        help="Run tests even when project files were not changed since the last successful test run",
+    )
 
 
 def _add_build_dags_parser_arguments(parser):
@@ -476,7 +485,7 @@ def _create_release_parser(subparsers):
 def _add_deploy_image_parser_arguments(parser):
     parser.add_argument('-i', '--image-tar-path',
                         type=str,
-                        help='Path to a Docker image file. The file name must contain version number with the following naming schema: image-{version}.tar')
+                        help='Path to a Docker image file. The file name must contain version number with the following naming schema: image-{version}.tar (or image-{version}.tar.gz)')
     parser.add_argument('-r', '--docker-repository',
                         type=str,
                         help='Name of a local and target Docker repository. Typically, a target repository is hosted by Google Cloud Container Registry.'
@@ -577,7 +586,7 @@ def find_image_file():
     for f in os.listdir(".image"):
         logger.debug("Found file %s", f)
 
-        if fnmatch.fnmatch(f, "*-*.tar"):
+        if fnmatch.fnmatch(f, "*-*.tar") or fnmatch.fnmatch(f, "*-*.tar.gz"):
             logger.info("Found image located at .image/%s", f)
             return f".image/{f}"
 
@@ -614,9 +623,9 @@ def _cli_build_image(args):
     )
 
 
-def _cli_build_package():
+def _cli_build_package(args):
     prj = bigflow.build.spec.get_project_spec()
-    bigflow.build.operate.build_package(prj)
+    bigflow.build.operate.build_package(prj, force_tests=args.force_tests)
 
 
 def _cli_build_dags(args):
@@ -636,6 +645,7 @@ def _cli_build(args):
         workflow_id=args.workflow if _is_workflow_selected(args) else None,
         export_image_tar=args.export_image_tar,
         cache_params=_grab_image_cache_params(args),
+        force_tests=args.force_tests,
     )
 
 
@@ -889,7 +899,7 @@ def cli(raw_args) -> None:
     elif operation == 'build-image':
         _cli_build_image(parsed_args)
     elif operation == 'build-package':
-        _cli_build_package()
+        _cli_build_package(parsed_args)
     elif operation == 'build':
         _cli_build(parsed_args)
     elif operation == 'start-project':
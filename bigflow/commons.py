@@ -279,12 +279,16 @@ def generate_file_hash(fname: Path, algorithm: str = 'sha256') -> str:
 
 
 def decode_version_number_from_file_name(file_path: Path):
-    if file_path.suffix != '.tar':
-        raise ValueError(f'*.tar file expected in {file_path.as_posix()}, got {file_path.suffix}')
+    if file_path.name.endswith('.tar.gz'):
+        stem = file_path.name[:-len('.tar.gz')]
+    elif file_path.suffix == '.tar':
+        stem = file_path.stem
+    else:
+        raise ValueError(f'*.tar or *.tar.gz file expected in {file_path.as_posix()}, got {file_path.suffix}')
     if not file_path.is_file():
         raise ValueError(f'File not found: {file_path.as_posix()}')
 
-    split = file_path.stem.split('-', maxsplit=1)
+    split = stem.split('-', maxsplit=1)
     if not len(split) == 2:
         raise ValueError(f'Invalid file name pattern: {file_path.as_posix()}, expected: *-{{version}}.tar, for example: image-0.1.0.tar')
     return split[1]
@@ -2,8 +2,10 @@ import os
 import time
 import inspect
 import logging
+import itertools
+import concurrent.futures
 
-from typing import List, Iterable
+from typing import List, Iterable, Tuple
 from pathlib import Path
 
 from bigflow.commons import (
@@ -27,9 +29,39 @@ logger = logging.getLogger(__name__)
 
 
 def find_all_resources(resources_dir: Path) -> Iterable[str]:
-    for path in resources_dir.rglob('*'):
-        if path.is_file():
-            yield str(path.relative_to(resources_dir.parent))
+    if not resources_dir.is_dir():
+        return
+
+    files, subdirs = _scan_dir(str(resources_dir))
+    if subdirs:
+        # overlap directory listing syscalls for big resource trees
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            files.extend(itertools.chain.from_iterable(executor.map(_scan_dir_recursive, subdirs)))
+
+    for path in files:
+        yield os.path.relpath(path, resources_dir.parent)
+
+
+def _scan_dir(path: str) -> Tuple[List[str], List[str]]:
+    # `DirEntry` provides file type without extra `stat` call (except symlinks)
+    files, subdirs = [], []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.is_file():
+                files.append(entry.path)
+    return files, subdirs
+
+
+def _scan_dir_recursive(path: str) -> List[str]:
+    result = []
+    stack = [path]
+    while stack:
+        files, subdirs = _scan_dir(stack.pop())
+        result.extend(files)
+        stack.extend(subdirs)
+    return result
 
 
 @public(
@@ -118,7 +150,7 @@ def find_setup(search_start_file: Path, retries_left: int = 10, sleep_time: floa
         if not retries_left:
             raise e
         time.sleep(sleep_time)
-        return find_setup(search_start_file, retries_left - 1)
+        return find_setup(search_start_file, retries_left - 1, sleep_time)
 
 
 @public(
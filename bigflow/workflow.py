@@ -1,4 +1,6 @@
+import re
 import abc
+import time
 import collections
 from typing import (
     Dict,
@@ -11,8 +13,11 @@ from typing import (
     OrderedDict,
     Set,
     Iterable,
+    Iterator,
+    Tuple,
 )
 import warnings
+import functools
 import datetime as dt
 import logging
 
@@ -39,7 +44,14 @@ DEFAULT_PIPELINE_LEVEL_EXECUTION_TIMEOUT_SHIFT_IN_SECONDS = DEFAULT_PIPELINE_LEV
 
 
 def get_timezone_offset_seconds() -> int:
-    return dt.datetime.now().astimezone().tzinfo.utcoffset(None).seconds
+    # Offset changes (DST etc) only at quarter-hour boundaries, cache it until the next one,
+    # so long-living processes don't keep a stale value.
+    return _get_timezone_offset_seconds(int(time.time() // 900))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_timezone_offset_seconds(quarter_of_hour: int) -> int:
+    return int(dt.datetime.now().astimezone().utcoffset().total_seconds())
 
 
 @public()
@@ -252,7 +264,7 @@ class WorkflowJob(Job):
         return hash(self.name)
 
     def __eq__(self, other):
-        return self.name == other.name
+        return self is other or self.name == other.name
 
     def __repr__(self):
         return "WorkflowJob{job=..., name=%s}" % self.name
@@ -279,9 +291,16 @@ class Definition:
     ) -> Dict[WorkflowJob, List[WorkflowJob]]:
         if isinstance(jobs, list):
             job_graph = self._convert_list_to_graph(jobs)
+            if len(set(jobs)) == len(jobs):
+                # linear chain of distinct jobs - acyclic by construction
+                return job_graph
         elif isinstance(jobs, dict):
+            # share one wrapper per job id, so graph lookups hit identity checks
+            interned: Dict[str, WorkflowJob] = {}
             job_graph = {
-                self._map_to_workflow_job(source_job): [self._map_to_workflow_job(tj) for tj in target_jobs]
+                self._map_to_workflow_job(source_job, interned): [
+                    self._map_to_workflow_job(tj, interned) for tj in target_jobs
+                ]
                 for source_job, target_jobs in jobs.items()
             }
         else:
@@ -290,22 +309,25 @@ class Definition:
         JobGraphValidator(job_graph).validate()
         return job_graph
 
-    def _map_to_workflow_job(self, job: Union[Job, WorkflowJob]) -> WorkflowJob:
-        if not isinstance(job, WorkflowJob):
-            job = WorkflowJob(job, job.id)
-        return job
+    def _map_to_workflow_job(
+            self,
+            job: Union[Job, WorkflowJob],
+            interned: Dict[str, WorkflowJob],
+    ) -> WorkflowJob:
+        if isinstance(job, WorkflowJob):
+            return interned.setdefault(job.name, job)
+        wjob = interned.get(job.id)
+        if wjob is None:
+            wjob = interned[job.id] = WorkflowJob(job, job.id)
+        return wjob
 
     @staticmethod
     def _convert_list_to_graph(
             job_list: List[WorkflowJob]
-    ) -> OrderedDict[WorkflowJob, List[WorkflowJob]]:
-        graph_as_dict = collections.OrderedDict()
+    ) -> Dict[WorkflowJob, List[WorkflowJob]]:
         if len(job_list) == 1:
-            graph_as_dict[job_list[0]] = []
-        else:
-            for i in range(1, len(job_list)):
-                graph_as_dict[job_list[i - 1]] = [job_list[i]]
-        return graph_as_dict
+            return {job_list[0]: []}
+        return {a: [b] for a, b in zip(job_list, job_list[1:])}
 
 
 class InvalidJobGraph(Exception):
@@ -325,47 +347,59 @@ class JobGraphValidator:
 
     def _validate_if_not_cyclic(self) -> None:
         visited = set()
-        stack = set()
         for job in self.job_graph:
-            self._validate_job(job, visited, stack)
+            self._validate_job(job, visited)
 
-    def _validate_job(self, job: WorkflowJob, visited: Set[WorkflowJob], stack: Set[WorkflowJob]) -> None:
-        if job in stack:
-            raise InvalidJobGraph(f"Found cyclic dependency on job {job}")
+    def _validate_job(self, job: WorkflowJob, visited: Set[WorkflowJob]) -> None:
         if job in visited:
             return
-
         visited.add(job)
-        if not job in self.job_graph:
-            return
-        stack.add(job)
-        for dep in self.job_graph[job]:
-            self._validate_job(dep, visited, stack)
-        stack.remove(job)
+
+        # iterative DFS, don't hit recursion limit on long pipelines
+        path = {job}
+        stack = [(job, iter(self.job_graph.get(job, ())))]
+        while stack:
+            current, deps = stack[-1]
+            for dep in deps:
+                if dep in path:
+                    raise InvalidJobGraph(f"Found cyclic dependency on job {dep}")
+                if dep not in visited:
+                    visited.add(dep)
+                    path.add(dep)
+                    stack.append((dep, iter(self.job_graph.get(dep, ()))))
+                    break
+            else:
+                stack.pop()
+                path.remove(current)
 
 
 class JobOrderResolver:
     def __init__(self, job_graph: Dict[WorkflowJob, List[WorkflowJob]]):
         self.job_graph = job_graph
         self.parental_map: OrderedDict[WorkflowJob, List[WorkflowJob]] = self._build_parental_map()
+        self.sequential_order: List[Tuple[WorkflowJob, List[WorkflowJob]]] = self._build_sequential_order()
 
     def find_sequential_run_order(self) -> List[WorkflowJob]:
-        ordered_jobs: List[WorkflowJob] = []
-
-        def add_to_ordered_job(job: WorkflowJob, dependencies: List[WorkflowJob]) -> None:
-            ordered_jobs.append(job)
-
-        self._call_on_graph_nodes(add_to_ordered_job)
-        return ordered_jobs
+        return [job for job, _dependencies in self.sequential_order]
 
     def _call_on_graph_nodes(
             self,
             consumer: Callable[[WorkflowJob, List[WorkflowJob]], None],
     ) -> None:
+        for job, dependencies in self.sequential_order:
+            consumer(job, dependencies)
+
+    def _build_sequential_order(self) -> List[Tuple[WorkflowJob, List[WorkflowJob]]]:
+        sequential_order = []
+
+        def add_to_sequential_order(job: WorkflowJob, dependencies: List[WorkflowJob]) -> None:
+            sequential_order.append((job, dependencies))
+
         visited = set()
         for job in self.parental_map:
             self._call_on_graph_node_helper(
-                job, self.parental_map, visited, consumer)
+                job, self.parental_map, visited, add_to_sequential_order)
+        return sequential_order
 
     def _build_parental_map(self) -> OrderedDict[WorkflowJob, List[WorkflowJob]]:
         visited = set()
@@ -380,18 +414,29 @@ class JobOrderResolver:
             parental_map: OrderedDict[WorkflowJob, List[WorkflowJob]],
             visited: Set[WorkflowJob],
     ) -> None:
-        if job not in self.job_graph or job in visited:
-            return
-        visited.add(job)
 
-        if job not in parental_map:
-            parental_map[job] = []
-
-        for dependency in self.job_graph[job]:
-            if dependency not in parental_map:
-                parental_map[dependency] = []
-            parental_map[dependency].append(job)
-            self._fill_parental_map(dependency, parental_map, visited)
+        def enter(job: WorkflowJob) -> Optional[Iterator[WorkflowJob]]:
+            if job not in self.job_graph or job in visited:
+                return None
+            visited.add(job)
+            if job not in parental_map:
+                parental_map[job] = []
+            return iter(self.job_graph[job])
+
+        dependencies = enter(job)
+        stack = [(job, dependencies)] if dependencies is not None else []
+        while stack:
+            current, dependencies = stack[-1]
+            for dependency in dependencies:
+                if dependency not in parental_map:
+                    parental_map[dependency] = []
+                parental_map[dependency].append(current)
+                subdependencies = enter(dependency)
+                if subdependencies is not None:
+                    stack.append((dependency, subdependencies))
+                    break
+            else:
+                stack.pop()
 
     def _call_on_graph_node_helper(
             self,
@@ -404,16 +449,32 @@ class JobOrderResolver:
             return
         visited.add(job)
 
-        for parent in parental_map[job]:
-            self._call_on_graph_node_helper(
-                parent, parental_map, visited, consumer)
-        consumer(job, parental_map[job])
+        # call consumer on all parents first (post-order DFS)
+        stack = [(job, iter(parental_map[job]))]
+        while stack:
+            current, parents = stack[-1]
+            for parent in parents:
+                if parent not in visited:
+                    visited.add(parent)
+                    stack.append((parent, iter(parental_map[parent])))
+                    break
+            else:
+                stack.pop()
+                consumer(current, parental_map[current])
+
+
+# Matches any of `_RUNTIME_FORMATS` (time part is optional), much faster than `strptime`
+_RUNTIME_RE = re.compile(r"""(?x)
+    (?P<year>\d{4}) - (?P<month>\d{1,2}) - (?P<day>\d{1,2} | \ [1-9])  # '%d' accepts space-padded day
+    (?: \s+ (?P<hour>\d{1,2}) : (?P<minute>\d{1,2}) : (?P<second>\d{1,2}) )?
+""", re.ASCII)
 
 
 def _parse_runtime_str(runtime: str) -> dt.datetime:
-    for format in _RUNTIME_FORMATS:
+    m = _RUNTIME_RE.fullmatch(runtime)
+    if m:
         try:
-            return dt.datetime.strptime(runtime, format)
+            return dt.datetime(*(int(x) for x in m.groups() if x is not None))
         except ValueError:
-            pass
+            pass  # out of range
     raise ValueError("Unable to parse 'runtime' %r" % runtime)
@@ -1,4 +1,7 @@
+import sys
+import textwrap
 import unittest
+import unittest.mock
 
 from test import mixins
 
@@ -43,6 +46,89 @@ class ReadProjectParametersTestCase(
             version="1.2.3",
         ), params)
 
+    def test_should_read_project_params_without_subprocess(self):
+        # given
+        bigflow.build.dev._read_setuppy_args.cache_clear()
+
+        # when
+        with unittest.mock.patch('bigflow.commons.run_process') as run_process_mock:
+            params = bigflow.build.dev.read_setuppy_args()
+
+        # then
+        run_process_mock.assert_not_called()
+        self.assertDictContainsSubset({'name': "bf_simple_v11"}, params)
+
+    def test_should_not_build_project_spec_when_reading_params(self):
+        # given
+        bigflow.build.dev._read_setuppy_args.cache_clear()
+
+        # when
+        with unittest.mock.patch('bigflow.build.spec.read_project_spec_nosetuppy') as read_spec_mock:
+            params = bigflow.build.dev.read_setuppy_args()
+
+        # then
+        read_spec_mock.assert_not_called()
+        self.assertDictContainsSubset({'name': "bf_simple_v11"}, params)
+
+    def test_should_fallback_to_subprocess_when_setuppy_exits(self):
+        # given
+        bigflow.build.dev._read_setuppy_args.cache_clear()
+        (self.cwd / "setup.py").write_text("import sys, bigflow.build; sys.exit(1)")
+
+        # when
+        with unittest.mock.patch('bigflow.build.dev._read_setuppy_args_subprocess') as subprocess_mock:
+            subprocess_mock.return_value = {'name': "bf_simple_v11"}
+            params = bigflow.build.dev.read_setuppy_args()
+
+        # then
+        subprocess_mock.assert_called_once_with(self.cwd / "setup.py")
+        self.assertEqual({'name': "bf_simple_v11"}, params)
+
+    def test_should_read_non_bigflow_setuppy_in_subprocess(self):
+        # given
+        bigflow.build.dev._read_setuppy_args.cache_clear()
+        (self.cwd / "setup.py").write_text("import setuptools; setuptools.setup()")
+
+        # when
+        with unittest.mock.patch('bigflow.build.dev._read_setuppy_args_inprocess') as inprocess_mock, \
+                unittest.mock.patch('bigflow.build.dev._read_setuppy_args_subprocess') as subprocess_mock:
+            subprocess_mock.return_value = {}
+            bigflow.build.dev.read_setuppy_args()
+
+        # then
+        inprocess_mock.assert_not_called()
+        subprocess_mock.assert_called_once_with(self.cwd / "setup.py")
+
+    def test_should_read_project_params_in_subprocess_when_threads_are_running(self):
+        # given
+        bigflow.build.dev._read_setuppy_args.cache_clear()
+
+        # when
+        with unittest.mock.patch('threading.active_count', return_value=2), \
+                unittest.mock.patch('bigflow.build.dev._read_setuppy_args_subprocess') as subprocess_mock:
+            subprocess_mock.return_value = {'name': "bf_simple_v11"}
+            bigflow.build.dev.read_setuppy_args()
+
+        # then
+        subprocess_mock.assert_called_once_with(self.cwd / "setup.py")
+
+    def test_should_unload_project_modules_imported_by_setuppy(self):
+        # given
+        bigflow.build.dev._read_setuppy_args.cache_clear()
+        (self.cwd / "setup_helper_module.py").write_text("NAME = 'from_helper'")
+        (self.cwd / "setup.py").write_text(textwrap.dedent("""
+            import bigflow.build
+            import setup_helper_module
+            bigflow.build.setup(name=setup_helper_module.NAME)
+        """))
+
+        # when
+        params = bigflow.build.dev.read_setuppy_args()
+
+        # then
+        self.assertEqual({'name': "from_helper"}, params)
+        self.assertNotIn("setup_helper_module", sys.modules)
+
     def test_should_read_project_params_from_subdir(self):
         # given
         self.chdir(self.cwd / "sudir" / "subsubdir")
@@ -1,8 +1,12 @@
+import shutil
+import subprocess
+
 from pathlib import PurePath, PurePosixPath
 from test import mixins
 
-from unittest.mock import patch, call
+from unittest.mock import patch, call, Mock
 
+import bigflow
 import bigflow.build.operate
 import bigflow.build.spec
 import bigflow.deploy
@@ -29,6 +33,11 @@ class BuildDockerImageTestCase(
         self.remove_docker_image_mock = self.addMock(patch('bigflow.commons.remove_docker_image_from_local_registry'))
         self.clear_image_leftovers_mock = self.addMock(patch('bigflow.build.operate.clear_image_leftovers'))
         self.get_docker_image_mock = self.addMock(patch('bigflow.commons.get_docker_image_id', return_value="12345"))
+        self.which_mock = self.addMock(patch('shutil.which', return_value=None))
+        self.addCleanup(bigflow.build.operate._ensure_buildx_builder.cache_clear)
+        self.addCleanup(bigflow.build.operate._is_buildx_available.cache_clear)
+        bigflow.build.operate._ensure_buildx_builder.cache_clear()
+        bigflow.build.operate._is_buildx_available.cache_clear()
 
         (self.cwd / "deployment_config.py").touch()
 
@@ -43,10 +52,81 @@ class BuildDockerImageTestCase(
         self.remove_docker_image_mock.assert_called_once_with("docker-repo:1.2")
 
         self.run_process_mock.assert_has_calls([
-            call(['docker', 'build', PurePosixPath('.'), '--tag', 'docker-repo:1.2', '--build-arg', 'BUILDKIT_INLINE_CACHE=1']),
+            call(['docker', 'buildx', 'build', PurePosixPath('.'), '--tag', 'docker-repo:1.2', '--load', '--progress=plain', '--build-arg', 'BUILDKIT_INLINE_CACHE=1']),
             call(['docker', 'image', 'save', '-o', PurePosixPath('.image/image-1.2.tar'), '12345']),
         ])
 
+    def test_build_image_compress_tar(self):
+
+        # given
+        self.which_mock.side_effect = lambda cmd: "/usr/bin/gzip" if cmd == "gzip" else None
+        popen_mock = self.addMock(patch('subprocess.Popen'))
+        popen_mock.return_value.wait.return_value = 0
+        self.project_spec.compress_image_tar = True
+
+        # when
+        bigflow.build.operate.build_image(self.project_spec, True, None)
+
+        # then
+        self.assertEqual(popen_mock.call_args_list[0][0], (['docker', 'image', 'save', '12345'],))
+        self.assertEqual(popen_mock.call_args_list[1][0], (['/usr/bin/gzip', '-1', '-c'],))
+        self.assertTrue((self.cwd / ".image" / "image-1.2.tar.gz").exists())
+        self.remove_docker_image_mock.assert_called_once_with("docker-repo:1.2")
+
+    def test_build_image_compress_tar_kills_save_when_compressor_fails(self):
+
+        # given
+        self.which_mock.side_effect = lambda cmd: "/usr/bin/gzip" if cmd == "gzip" else None
+        save_mock = Mock()
+        popen_mock = self.addMock(patch('subprocess.Popen'))
+        popen_mock.side_effect = [save_mock, OSError("no gzip")]
+        self.project_spec.compress_image_tar = True
+
+        # when
+        with self.assertRaises(OSError):
+            bigflow.build.operate.build_image(self.project_spec, True, None)
+
+        # then
+        save_mock.kill.assert_called_once()
+        save_mock.wait.assert_called_once()
+
+    def test_build_image_dont_compress_tar_by_default(self):
+
+        # given
+        self.which_mock.side_effect = lambda cmd: "/usr/bin/gzip" if cmd == "gzip" else None
+        popen_mock = self.addMock(patch('subprocess.Popen'))
+
+        # when
+        bigflow.build.operate.build_image(self.project_spec, True, None)
+
+        # then
+        popen_mock.assert_not_called()
+        self.run_process_mock.assert_called_with(['docker', 'image', 'save', '-o', PurePosixPath('.image/image-1.2.tar'), '12345'])
+
+    def test_build_image_generate_dockerignore(self):
+
+        # when
+        with self.assertLogs(bigflow.build.operate.logger, level='WARNING'):
+            bigflow.build.operate.build_image(self.project_spec, False, None)
+
+        # then
+        dockerignore = (self.cwd / ".dockerignore").read_text()
+        self.assertIn("autogenerated by bigflow", dockerignore)
+        self.assertIn("\nbuild\n", dockerignore)
+        self.assertIn("\n.git\n", dockerignore)
+        self.assertNotIn("dist", dockerignore)
+
+    def test_build_image_keep_custom_dockerignore(self):
+
+        # given
+        (self.cwd / ".dockerignore").write_text("custom")
+
+        # when
+        bigflow.build.operate.build_image(self.project_spec, False, None)
+
+        # then
+        self.assertEqual((self.cwd / ".dockerignore").read_text(), "custom")
+
     def test_build_image_notar_respect_project_defaults(self):
 
         for project_global_setting, cli_arg_setting, should_export_tar in [
@@ -88,7 +168,7 @@ class BuildDockerImageTestCase(
         self.remove_docker_image_mock.assert_not_called()
 
         self.run_process_mock.assert_has_calls([
-            call(['docker', 'build', PurePosixPath('.'), '--tag', 'docker-repo:1.2', '--build-arg', 'BUILDKIT_INLINE_CACHE=1']),
+            call(['docker', 'buildx', 'build', PurePosixPath('.'), '--tag', 'docker-repo:1.2', '--load', '--progress=plain', '--build-arg', 'BUILDKIT_INLINE_CACHE=1']),
         ])
 
     def test_build_image_cache_image(self):
@@ -108,7 +188,14 @@ class BuildDockerImageTestCase(
         self.remove_docker_image_mock.assert_called_once_with("docker-repo:1.2")
 
         self.run_process_mock.assert_has_calls([
-            call(['docker', 'build', PurePosixPath('.'), '--tag', 'docker-repo:1.2', '--cache-from', 'xyz.org/foo:bar', '--build-arg', 'BUILDKIT_INLINE_CACHE=1']),
+            call([
+                'docker', 'buildx', 'build', PurePosixPath('.'), '--tag', 'docker-repo:1.2', '--load', '--progress=plain',
+                '--builder', 'bigflow',
+                '--cache-from', 'xyz.org/foo:bar',
+                '--cache-from', 'type=registry,ref=docker-repo:buildcache',
+                '--cache-to', 'type=registry,ref=docker-repo:buildcache,mode=max',
+                '--build-arg', 'BUILDKIT_INLINE_CACHE=1',
+            ]),
             call(['docker', 'image', 'save', '-o', PurePosixPath('.image/image-1.2.tar'), '12345']),
         ])
 
@@ -129,6 +216,311 @@ class BuildDockerImageTestCase(
         self.remove_docker_image_mock.assert_called_once_with("docker-repo:1.2")
 
         self.run_process_mock.assert_has_calls([
-            call(['docker', 'build', PurePosixPath('.'), '--tag', 'docker-repo:1.2', '--cache-from', 'docker-repo:1.1', '--build-arg', 'BUILDKIT_INLINE_CACHE=1']),
+            call([
+                'docker', 'buildx', 'build', PurePosixPath('.'), '--tag', 'docker-repo:1.2', '--load', '--progress=plain',
+                '--builder', 'bigflow',
+                '--cache-from', 'docker-repo:1.1',
+                '--cache-from', 'type=registry,ref=docker-repo:buildcache',
+                '--cache-to', 'type=registry,ref=docker-repo:buildcache,mode=max',
+                '--build-arg', 'BUILDKIT_INLINE_CACHE=1',
+            ]),
             call(['docker', 'image', 'save', '-o', PurePosixPath('.image/image-1.2.tar'), '12345']),
         ])
+
+    def test_build_image_create_buildx_builder(self):
+
+        # given
+        def run_process(cmd, **kwargs):
+            if cmd[:3] == ['docker', 'buildx', 'inspect']:
+                raise subprocess.CalledProcessError(1, cmd)
+        self.run_process_mock.side_effect = run_process
+        cache_params = bigflow.build.operate.BuildImageCacheParams(
+            auth_method=bigflow.deploy.AuthorizationType.LOCAL_ACCOUNT,
+        )
+
+        # when
+        bigflow.build.operate._build_docker_image(self.project_spec, "docker-repo:1.2", cache_params)
+        bigflow.build.operate._build_docker_image(self.project_spec, "docker-repo:1.3", cache_params)
+
+        # then
+        inspect_call = call(['docker', 'buildx', 'inspect', 'bigflow'], verbose=False)
+        create_call = call(['docker', 'buildx', 'create', '--driver', 'docker-container', '--name', 'bigflow'])
+        self.assertEqual(1, self.run_process_mock.call_args_list.count(inspect_call))
+        self.assertEqual(1, self.run_process_mock.call_args_list.count(create_call))
+
+    def test_build_image_fallback_to_docker_build_without_buildx(self):
+
+        # given
+        def run_process(cmd, **kwargs):
+            if cmd[:2] == ['docker', 'buildx']:
+                raise subprocess.CalledProcessError(1, cmd)
+        self.run_process_mock.side_effect = run_process
+        cache_params = bigflow.build.operate.BuildImageCacheParams(
+            auth_method=bigflow.deploy.AuthorizationType.LOCAL_ACCOUNT,
+            cache_from_image=['docker-repo/cache'],
+        )
+
+        # when
+        with self.assertLogs(level='WARNING'):
+            bigflow.build.operate._build_docker_image(self.project_spec, "docker-repo:1.2", cache_params)
+
+        # then
+        self.run_process_mock.assert_called_with(
+            ['docker', 'build', PurePosixPath('.'), '--tag', 'docker-repo:1.2',
+             '--cache-from', 'docker-repo/cache',
+             '--build-arg', 'BUILDKIT_INLINE_CACHE=1'],
+            env_add={'DOCKER_BUILDKIT': "1"},
+        )
+        self.auth_registry_mock.assert_called_once()
+
+
+class BuildDagsTestCase(
+    mixins.BaseTestCase,
+    mixins.TempCwdMixin,
+):
+
+    def setUp(self):
+        super().setUp()
+        self.project_spec = bigflow.build.spec.parse_project_spec(
+            name="test_project",
+            project_dir=self.cwd,
+            docker_repository="docker-repo",
+            version="1.2",
+            packages=["test_project"],
+            requries=[],
+        )
+
+    def test_build_dags_for_many_workflows(self):
+
+        # given
+        workflows = [
+            bigflow.Workflow(workflow_id=f"workflow{i}", definition=[FakeJob(f"job{i}")])
+            for i in range(5)
+        ]
+        self.addMock(patch('bigflow.cli.walk_workflows', return_value=workflows))
+
+        # when
+        bigflow.build.operate.build_dags(self.project_spec, "2020-01-01 00:00:00")
+
+        # then
+        dags = sorted(p.name for p in (self.cwd / ".dags").glob("*_dag.py"))
+        self.assertEqual(dags, [f"workflow{i}__v1_2__2020_01_01_00_00_00_dag.py" for i in range(5)])
+
+    def test_build_dags_for_selected_workflow(self):
+
+        # given
+        workflows = [
+            bigflow.Workflow(workflow_id=f"workflow{i}", definition=[FakeJob(f"job{i}")])
+            for i in range(3)
+        ]
+        self.addMock(patch('bigflow.cli.walk_workflows', return_value=workflows))
+
+        # when
+        bigflow.build.operate.build_dags(self.project_spec, "2020-01-01 00:00:00", workflow_id="workflow1")
+
+        # then
+        dags = [p.name for p in (self.cwd / ".dags").glob("*_dag.py")]
+        self.assertEqual(dags, ["workflow1__v1_2__2020_01_01_00_00_00_dag.py"])
+
+    def test_build_dags_for_prescanned_workflows(self):
+
+        # given
+        workflows = [
+            (bigflow.Workflow(workflow_id=f"workflow{i}", definition=[FakeJob(f"job{i}")]), "test_project")
+            for i in range(2)
+        ]
+        walk_workflows_mock = self.addMock(patch('bigflow.cli.walk_workflows'))
+
+        # when
+        bigflow.build.operate.build_dags(
+            self.project_spec, "2020-01-01 00:00:00", workflow_id="workflow1", workflows=workflows)
+
+        # then
+        walk_workflows_mock.assert_not_called()
+        dags = [p.name for p in (self.cwd / ".dags").glob("*_dag.py")]
+        self.assertEqual(dags, ["workflow1__v1_2__2020_01_01_00_00_00_dag.py"])
+
+
+class FakeJob(bigflow.Job):
+
+    def __init__(self, id):
+        super().__init__(id=id)
+
+    def execute(self, context):
+        pass
+
+
+class RunTestsTestCase(
+    mixins.BaseTestCase,
+    mixins.TempCwdMixin,
+):
+
+    def setUp(self):
+        super().setUp()
+        self.project_spec = bigflow.build.spec.parse_project_spec(
+            name="test_project",
+            project_dir=self.cwd,
+            docker_repository="docker-repo",
+            version="1.2",
+            requries=[],
+            test_framework='pytest',
+        )
+        self.run_process_mock = self.addMock(patch('bigflow.commons.run_process'))
+
+    def test_run_pytest_in_parallel_when_xdist_is_available(self):
+
+        # given
+        self.project_spec.test_parallel = True
+
+        # when
+        bigflow.build.operate.run_tests(self.project_spec)
+
+        # then
+        self.run_process_mock.assert_any_call(["python", "-c", "import xdist"], verbose=False)
+        (cmd,), _ = self.run_process_mock.call_args
+        self.assertEqual(cmd[-2:], ["--numprocesses", "auto"])
+
+    def test_run_pytest_sequentially_without_xdist(self):
+
+        # given
+        self.project_spec.test_parallel = True
+
+        def run_process(cmd, **kwargs):
+            if cmd[:2] == ["python", "-c"]:
+                raise subprocess.CalledProcessError(1, cmd)
+        self.run_process_mock.side_effect = run_process
+
+        # when
+        with self.assertLogs(bigflow.build.operate.logger, level='WARNING'):
+            bigflow.build.operate.run_tests(self.project_spec)
+
+        # then
+        (cmd,), _ = self.run_process_mock.call_args
+        self.assertNotIn("--numprocesses", cmd)
+
+    def test_run_pytest_sequentially_by_default(self):
+
+        # when
+        bigflow.build.operate.run_tests(self.project_spec)
+
+        # then
+        self.run_process_mock.assert_called_once()
+        (cmd,), _ = self.run_process_mock.call_args
+        self.assertNotIn("--numprocesses", cmd)
+
+
+class BuildPackageTestCase(
+    mixins.BaseTestCase,
+    mixins.TempCwdMixin,
+    mixins.FileUtilsMixin,
+):
+
+    def setUp(self):
+        super().setUp()
+        self.project_spec = bigflow.build.spec.parse_project_spec(
+            name="test_project",
+            project_dir=self.cwd,
+            docker_repository="docker-repo",
+            version="1.2",
+            packages=["test_project"],
+            requries=[],
+        )
+        (self.cwd / "test_project").mkdir()
+        (self.cwd / "test_project" / "__init__.py").write_text("")
+
+        self.addMock(patch('bigflow.build.pip.maybe_recompile_requirements_file', return_value=False))
+        self.addMock(patch('bigflow.build.dataflow.dependency_checker.check_beam_worker_dependencies_conflict'))
+        self.run_setup_command_mock = self.addMock(patch('bigflow.build.dist.run_setup_command'))
+        self.run_tests_mock = self.addMock(patch('bigflow.build.operate.run_tests'))
+        self.run_tests_mock.side_effect = self._write_junit_report
+
+    def _write_junit_report(self, project_spec):
+        report = self.cwd / "build" / "junit-reports" / "report.xml"
+        report.parent.mkdir(parents=True, exist_ok=True)
+        report.write_text("<testsuites/>")
+
+    def test_should_skip_tests_when_project_files_are_not_changed(self):
+
+        # when
+        bigflow.build.operate.build_package(self.project_spec)
+        (self.cwd / "build" / "lib").mkdir()
+        (self.cwd / "build" / "lib" / "module.py").write_text("")
+        bigflow.build.operate.build_package(self.project_spec)
+
+        # then
+        self.run_tests_mock.assert_called_once_with(self.project_spec)
+        self.assertEqual(self.run_setup_command_mock.call_count, 2)
+        self.assertFileContentRegex("build/junit-reports/report.xml", r"<testsuites/>")
+        self.assertFalse((self.cwd / "build" / "lib").exists())
+
+    def test_should_skip_tests_when_only_dockerignore_is_generated(self):
+
+        # when
+        bigflow.build.operate.build_package(self.project_spec)
+        bigflow.build.operate._ensure_dockerignore(self.cwd)
+        bigflow.build.operate.build_package(self.project_spec)
+
+        # then
+        self.run_tests_mock.assert_called_once_with(self.project_spec)
+
+    def test_should_rerun_tests_when_report_is_missing(self):
+
+        # given
+        bigflow.build.operate.build_package(self.project_spec)
+
+        # when
+        shutil.rmtree(self.cwd / "build" / "junit-reports")
+        bigflow.build.operate.build_package(self.project_spec)
+
+        # then
+        self.assertEqual(self.run_tests_mock.call_count, 2)
+        self.assertTrue((self.cwd / "build" / "junit-reports" / "report.xml").exists())
+
+    def test_should_rerun_tests_when_project_files_are_changed(self):
+
+        # given
+        bigflow.build.operate.build_package(self.project_spec)
+
+        # when
+        (self.cwd / "test_project" / "workflow.py").write_text("import bigflow")
+        bigflow.build.operate.build_package(self.project_spec)
+
+        # then
+        self.assertEqual(self.run_tests_mock.call_count, 2)
+
+    def test_should_rerun_tests_when_nested_build_package_is_changed(self):
+
+        # given
+        (self.cwd / "test_project" / "build").mkdir()
+        (self.cwd / "test_project" / "build" / "__init__.py").write_text("")
+        bigflow.build.operate.build_package(self.project_spec)
+
+        # when
+        (self.cwd / "test_project" / "build" / "__init__.py").write_text("import bigflow")
+        bigflow.build.operate.build_package(self.project_spec)
+
+        # then
+        self.assertEqual(self.run_tests_mock.call_count, 2)
+
+    def test_should_rerun_tests_when_python_is_changed(self):
+
+        # given
+        bigflow.build.operate.build_package(self.project_spec)
+
+        # when
+        with patch('sys.executable', "/other/venv/bin/python"):
+            bigflow.build.operate.build_package(self.project_spec)
+
+        # then
+        self.assertEqual(self.run_tests_mock.call_count, 2)
+
+    def test_should_rerun_tests_when_forced(self):
+
+        # given
+        bigflow.build.operate.build_package(self.project_spec)
+
+        # when
+        bigflow.build.operate.build_package(self.project_spec, force_tests=True)
+
+        # then
+        self.assertEqual(self.run_tests_mock.call_count, 2)
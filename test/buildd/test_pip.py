@@ -2,6 +2,7 @@ import logging
 import unittest
 
 from pathlib import Path
+from unittest import mock
 
 from test import mixins
 
@@ -98,6 +99,21 @@ class PipToolsTestCase(
         # then
         self.assertTrue(req_txt.exists())
 
+    def test_should_not_recompile_fresh_requirements(self):
+        # given
+        req_in = self.cwd / "req.in"
+        req_txt = self.cwd / "req.txt"
+        req_in.write_text("numpy")
+        req_txt.write_text(f"# $source-hash: {bf_pip.compute_requirements_in_hash(req_in)}\nnumpy==1.0\n")
+
+        # when
+        with mock.patch.object(bf_pip, 'pip_compile') as pip_compile_mock:
+            recompiled = bf_pip.maybe_recompile_requirements_file(req_txt)
+
+        # then
+        self.assertFalse(recompiled)
+        pip_compile_mock.assert_not_called()
+
     def test_read_all_requirements_from_the_hierarchy(self):
         # given
         (self.cwd / "requirements.txt").write_text("""
@@ -34,6 +34,53 @@ class ReadSpecTestCase(
         self.assertTrue(len(logs.records))
         self.assertEqual(v, "INVALID")
 
+    def test_should_import_deployment_config_only_once(self):
+        # given
+        dc = self.cwd / "deployment_config.py"
+        dc.write_text(textwrap.dedent("""
+            import bigflow
+            deployment_config = bigflow.Config(name='dev', properties={'docker_repository': "docker_repository"})
+        """))
+
+        import bigflow.cli
+        with mock.patch.object(
+            bigflow.cli, 'import_deployment_config', wraps=bigflow.cli.import_deployment_config,
+        ) as import_mock:
+
+            # when
+            r1 = spec.get_docker_repository_from_deployment_config(dc)
+            r2 = spec.get_docker_repository_from_deployment_config(dc)
+
+        # then
+        self.assertEqual(r1, "docker_repository")
+        self.assertEqual(r2, "docker_repository")
+        import_mock.assert_called_once()
+
+    @mock.patch('bigflow.version.get_version')
+    def test_should_detect_version_only_once(self, get_version_mock: mock.Mock):
+        # given
+        self.addCleanup(spec._detect_version_cached.cache_clear)
+        get_version_mock.return_value = "1.2.3"
+
+        # when
+        v1 = spec.secure_get_version()
+        v2 = spec.secure_get_version()
+
+        # then
+        self.assertEqual(v1, "1.2.3")
+        self.assertEqual(v2, "1.2.3")
+        get_version_mock.assert_called_once()
+
+    @mock.patch('bigflow.version.get_version')
+    def test_should_take_version_from_env_variable(self, get_version_mock: mock.Mock):
+        # when
+        with mock.patch.dict('os.environ', {'BIGFLOW_VERSION': "4.5.6"}):
+            v = spec.secure_get_version()
+
+        # then
+        self.assertEqual(v, "4.5.6")
+        get_version_mock.assert_not_called()
+
     def test_docker_repository_not_in_lower_case(self):
 
         # given
@@ -105,7 +152,9 @@ class _BaseRealProjectTest(
             'url': "http://example.org/myproject",
         }
         s.test_framework = 'pytest'
+        s.test_parallel = True
         s.export_image_tar = False
+        s.compress_image_tar = True
 
         # when
         spec.add_spec_to_pyproject_toml(self.cwd / "pyproject.toml", s)
@@ -123,7 +172,9 @@ class _BaseRealProjectTest(
             'metainfo',
             'data_files',
             'test_framework',
+            'test_parallel',
             'export_image_tar',
+            'compress_image_tar',
         ]:
             self.assertEqual(getattr(s, f), getattr(ss, f), f"field {f} should be same")
 
@@ -640,6 +640,7 @@ deployment_config = Config(name='dev',
             workflow_id=None,
             cache_params=None,
             export_image_tar=None,
+            force_tests=False,
         )
 
     def test_should_call_cli_build_image_command_without_tar(self):
@@ -762,6 +763,7 @@ deployment_config = Config(name='dev',
             workflow_id=None,
             cache_params=None,
             export_image_tar=None,
+            force_tests=False,
         )
 
     @mock.patch('bigflow.cli._cli_build_package')
@@ -770,7 +772,21 @@ deployment_config = Config(name='dev',
         cli(['build-package'])
 
         # then
-        _cli_build_package_mock.assert_called_with()
+        _cli_build_package_mock.assert_called_with(Namespace(
+            force_tests=False,
+            operation='build-package',
+            verbose=False,
+        ))
+
+        # when
+        cli(['build-package', '--force-tests'])
+
+        # then
+        _cli_build_package_mock.assert_called_with(Namespace(
+            force_tests=True,
+            operation='build-package',
+            verbose=False,
+        ))
 
     @mock.patch('bigflow.cli._cli_build')
     def test_should_call_cli_build_command(self, _cli_build_mock):
@@ -782,6 +798,7 @@ deployment_config = Config(name='dev',
             cache_from_version=None,
             deployment_config_path=None,
             export_image_tar=None,
+            force_tests=False,
             operation='build',
             start_time=None,
             vault_endpoint=None,
@@ -822,7 +839,7 @@ deployment_config = Config(name='dev',
 
         # then
         read_project_mock.assert_called_once()
-        build_package_mock.assert_any_call(read_project_mock.return_value)
+        build_package_mock.assert_any_call(read_project_mock.return_value, force_tests=False)
 
     @mock.patch('bigflow.build.operate.build_image')
     @mock.patch('bigflow.build.spec.read_project_spec')
@@ -10,13 +10,16 @@ class CliTestCase(TestCase):
         # given
         f_release = self._touch_file('image-0.1.0.tar')
         f_dev = self._touch_file('image-0.3.0.dev-4b45b638.tar')
+        f_compressed = self._touch_file('image-0.2.0.tar.gz')
 
         # expect
         self.assertEqual(decode_version_number_from_file_name(f_release), '0.1.0')
         self.assertEqual(decode_version_number_from_file_name(f_dev), '0.3.0.dev-4b45b638')
+        self.assertEqual(decode_version_number_from_file_name(f_compressed), '0.2.0')
 
         f_release.unlink()
         f_dev.unlink()
+        f_compressed.unlink()
 
     def test_should_raise_error_when_given_image_file_is_not_tar(self):
         # given
@@ -7,8 +7,6 @@ import os
 
 from unittest import TestCase, mock
 
-from google.cloud import logging_v2
-
 import bigflow.log
 
 
@@ -34,8 +32,9 @@ class LoggerTestCase(TestCase):
         self.root_logger = logging.getLogger('')
 
     def _clear_all_root_loggers(self):
-        for h in logging.getLogger().handlers[:]:
-            logging.getLogger().removeHandler(h)
+        root_logger = logging.getLogger()
+        for h in root_logger.handlers[:]:
+            root_logger.removeHandler(h)
             h.close()
 
     def tearDown(self):
@@ -77,8 +77,9 @@ class FindSetupTestCase(TestCase):
         # then
         self.assertEqual(setup_path, Path(__file__).parent.parent / 'setup.py')
 
+    @mock.patch('bigflow.resources.time.sleep')
     @mock.patch('bigflow.resources.find_file')
-    def test_should_retry_n_times(self, find_file_mock):
+    def test_should_retry_n_times(self, find_file_mock, sleep_mock):
         # given
         find_file_mock.side_effect = self.raise_value_error
 
@@ -89,6 +90,8 @@ class FindSetupTestCase(TestCase):
 
         # and
         self.assertEqual(find_file_mock.call_count, 3)
+        sleep_mock.assert_has_calls([mock.call(0.01), mock.call(0.01)])
+        self.assertEqual(sleep_mock.call_count, 2)
 
     def raise_value_error(self, *args, **kwargs):
         raise ValueError('Setup file not found')
@@ -1,3 +1,5 @@
+import os
+import time
 import datetime
 import bigflow
 import freezegun
@@ -5,9 +7,8 @@ import freezegun
 from collections import OrderedDict
 from unittest import TestCase, mock
 
-from google.cloud import logging_v2
-
-from bigflow.workflow import JobContext, Workflow, Definition, InvalidJobGraph, WorkflowJob
+from bigflow.workflow import JobContext, Workflow, Definition, InvalidJobGraph, WorkflowJob, get_timezone_offset_seconds, hourly_start_time
+from bigflow.workflow import _get_timezone_offset_seconds
 
 
 class WorkflowTestCase(TestCase):
@@ -146,10 +147,27 @@ class WorkflowTestCase(TestCase):
         for dt_str, expected in [
             ("2020-01-02", datetime.datetime(2020, 1, 2)),
             ("2020-01-02 10:15:20", datetime.datetime(2020, 1, 2, 10, 15, 20)),
+            ("2020-01- 2", datetime.datetime(2020, 1, 2)),
+            ("2020-01- 2 10:15:20", datetime.datetime(2020, 1, 2, 10, 15, 20)),
         ]:
             jc = bigflow.JobContext.make(runtime=dt_str)
             self.assertEqual(jc.runtime, expected)
 
+    def test_should_fail_on_invalid_string_runtime(self):
+        for dt_str in [
+            "",
+            "2020-01",
+            "2020-13-02",
+            "2020-01-02 10:15",
+            "2020-01-02 25:15:20",
+            "2020-01-02T10:15:20",
+            "2020-01-02 10:15:20 ",
+            "2020- 1-02",
+            "2020-01- 0",
+        ]:
+            with self.assertRaises(ValueError):
+                bigflow.JobContext.make(runtime=dt_str)
+
     def test_should_convert_date_to_datetime(self):
         # given
         dt = datetime.date(2020, 1, 2)
@@ -216,6 +234,51 @@ class WorkflowTestCase(TestCase):
         with self.assertRaises(InvalidJobGraph):
             Definition(job_graph)
 
+    def test_should_share_wrapper_of_the_same_job(self):
+        # given
+        job1, job2, job3 = [mock.Mock(id=f"job{i}") for i in range(1, 4)]
+
+        # when
+        definition = Definition({
+            job1: [job2, job3],
+            job2: [job3],
+        })
+
+        # then
+        graph = definition.job_graph
+        wjob1, wjob2 = graph
+        self.assertIs(wjob2, graph[wjob1][0])
+        self.assertIs(graph[wjob1][1], graph[wjob2][0])
+        self.assertIs(job3, graph[wjob2][0].job)
+
+    def test_should_throw_exception_when_job_repeats_in_list(self):
+        # given
+        original_job = mock.Mock()
+        job1, job2 = [WorkflowJob(original_job, i) for i in range(2)]
+
+        # expected
+        with self.assertRaises(InvalidJobGraph):
+            Definition([job1, job2, job1])
+
+    def test_should_handle_long_pipelines(self):
+        # given
+        original_job = mock.Mock()
+        jobs = [WorkflowJob(original_job, i) for i in range(5000)]
+
+        # when
+        definition = Definition(jobs)
+
+        # then
+        self.assertEqual(definition._sequential_order(), jobs)
+
+        # given
+        job_graph = {a: (b,) for a, b in zip(jobs, jobs[1:])}
+        job_graph[jobs[-1]] = (jobs[0],)
+
+        # expected
+        with self.assertRaises(InvalidJobGraph):
+            Definition(job_graph)
+
     def test_should_run_jobs_in_order_accordingly_to_graph_schema(self):
         # given
         original_job = mock.Mock()
@@ -278,4 +341,55 @@ class WorkflowTestCase(TestCase):
         workflow = Workflow(workflow_id='test_workflow', definition=definition, schedule_interval='@hourly')
 
         # expected
-        self.assertEqual(workflow._build_sequential_order(), [job1, job5, job2, job3, job6, job9, job4, job7, job8])
\ No newline at end of file
+        self.assertEqual(workflow._build_sequential_order(), [job1, job5, job2, job3, job6, job9, job4, job7, job8])
+
+
+class HourlyStartTimeTestCase(TestCase):
+
+    def setUp(self):
+        environ_patch = mock.patch.dict(os.environ)
+        environ_patch.start()
+        self.addCleanup(_get_timezone_offset_seconds.cache_clear)
+        self.addCleanup(time.tzset)
+        self.addCleanup(environ_patch.stop)
+
+    def set_timezone(self, tz):
+        os.environ['TZ'] = tz
+        time.tzset()
+        _get_timezone_offset_seconds.cache_clear()
+
+    def test_should_refresh_timezone_offset_every_quarter_of_hour(self):
+        # given
+        self.set_timezone("XYZ-2")
+        with mock.patch('time.time', return_value=0):
+            self.assertEqual(get_timezone_offset_seconds(), 2 * 3600)
+
+        # when
+        os.environ['TZ'] = "XYZ+5"  # like DST switch
+        time.tzset()
+
+        # then
+        with mock.patch('time.time', return_value=899):
+            self.assertEqual(get_timezone_offset_seconds(), 2 * 3600)
+        with mock.patch('time.time', return_value=900):
+            self.assertEqual(get_timezone_offset_seconds(), -5 * 3600)
+
+    def test_should_convert_start_time_to_utc_for_positive_offset(self):
+        # given
+        self.set_timezone("XYZ-2")  # UTC+2, posix notation has inverted sign
+
+        # expected
+        self.assertEqual(get_timezone_offset_seconds(), 2 * 3600)
+        self.assertEqual(
+            hourly_start_time(datetime.datetime(2020, 1, 1, 10, 0, 0, 123)),
+            datetime.datetime(2020, 1, 1, 8, 0, 0))
+
+    def test_should_convert_start_time_to_utc_for_negative_offset(self):
+        # given
+        self.set_timezone("XYZ+5")  # UTC-5
+
+        # expected
+        self.assertEqual(get_timezone_offset_seconds(), -5 * 3600)
+        self.assertEqual(
+            hourly_start_time(datetime.datetime(2020, 1, 1, 10, 0, 0)),
+            datetime.datetime(2020, 1, 1, 15, 0, 0))